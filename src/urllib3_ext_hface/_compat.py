@@ -0,0 +1,25 @@
+# Copyright 2022 Akamai Technologies, Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+#: Keyword arguments for :func:`dataclasses.dataclass` on hot, frequently
+#: allocated types. The "slots" parameter is only available starting with
+#: Python 3.10.
+DATACLASS_OPTIONS: dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
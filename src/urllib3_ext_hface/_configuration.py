@@ -17,8 +17,10 @@ from __future__ import annotations
 import dataclasses
 from typing import Any
 
+from ._compat import DATACLASS_OPTIONS
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(**DATACLASS_OPTIONS)
 class QuicTLSConfig:
     """
     Client TLS configuration.
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from .._compat import DATACLASS_OPTIONS
 from .._typing import HeadersType
 
 
@@ -26,13 +27,15 @@ class Event:
     This is an abstract base class that should not be initialized.
     """
 
+    __slots__ = ()
+
 
 #
 # Connection events
 #
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ConnectionTerminated(Event):
     """
     Connection was terminated.
@@ -51,7 +54,7 @@ class ConnectionTerminated(Event):
         return f"{cls}(error_code={self.error_code!r}, message={self.message!r})"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class GoawayReceived(Event):
     """
     GOAWAY frame was received
@@ -78,7 +81,7 @@ class GoawayReceived(Event):
 #
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class StreamEvent(Event):
     """
     Event on one HTTP stream.
@@ -92,7 +95,7 @@ class StreamEvent(Event):
     stream_id: int
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class StreamReset(StreamEvent):
     """
     One stream of an HTTP connection was reset.
@@ -115,7 +118,7 @@ class StreamReset(StreamEvent):
         return f"{cls}(stream_id={self.stream_id!r}, error_code={self.error_code!r})"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class StreamResetReceived(StreamReset):
     """
     One stream of an HTTP connection was reset by the peer.
@@ -126,7 +129,7 @@ class StreamResetReceived(StreamReset):
     """
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class StreamResetSent(StreamReset):
     """
     One stream of an HTTP connection was reset by us.
@@ -138,7 +141,7 @@ class StreamResetSent(StreamReset):
     """
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class HandshakeCompleted(Event):
     alpn_protocol: str | None
 
@@ -147,7 +150,7 @@ class HandshakeCompleted(Event):
         return f"{cls}(alpn={self.alpn_protocol})"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class HeadersReceived(StreamEvent):
     """
     A frame with HTTP headers was received.
@@ -169,7 +172,7 @@ class HeadersReceived(StreamEvent):
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class DataReceived(StreamEvent):
     """
     A frame with HTTP data was received.
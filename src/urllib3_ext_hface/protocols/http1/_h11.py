@@ -160,6 +160,13 @@ def headers_from_response(
     return pseudo_headers + regular_headers
 
 
+_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    h11.LocalProtocolError,
+    h11.ProtocolError,
+    h11.RemoteProtocolError,
+)
+
+
 class HTTP1ProtocolHyperImpl(HTTP1Protocol):
     implementation: str = "h11"
 
@@ -174,7 +181,7 @@ class HTTP1ProtocolHyperImpl(HTTP1Protocol):
 
     @staticmethod
     def exceptions() -> tuple[type[BaseException], ...]:
-        return h11.LocalProtocolError, h11.ProtocolError, h11.RemoteProtocolError
+        return _EXCEPTIONS
 
     @property
     def http_version(self) -> str:
@@ -280,7 +287,7 @@ class HTTP1ProtocolHyperImpl(HTTP1Protocol):
         return self._event_buffer.popleft()
 
     def has_pending_event(self) -> bool:
-        return len(self._event_buffer) > 0
+        return bool(self._event_buffer)
 
     def _h11_submit(self, h11_event: h11.Event) -> None:
         chunks = self._connection.send_with_data_passthrough(h11_event)
@@ -14,8 +14,9 @@
 
 from __future__ import annotations
 
+import functools
 from collections import deque
-from typing import Iterator, cast
+from typing import Any, Callable
 
 import h2.config
 import h2.connection
@@ -36,6 +37,34 @@ from ...events import (
 from .._protocols import HTTP2Protocol
 
 
+@functools.lru_cache(maxsize=16)
+def _get_h2_config(
+    validate_outbound_headers: bool,
+    validate_inbound_headers: bool,
+    normalize_outbound_headers: bool,
+    normalize_inbound_headers: bool,
+) -> h2.config.H2Configuration:
+    """
+    Return a client configuration shared among connections with the same flags.
+
+    h2 never mutates its configuration, and the four flags only allow
+    for 16 combinations.
+    """
+    return h2.config.H2Configuration(
+        client_side=True,
+        validate_outbound_headers=validate_outbound_headers,
+        normalize_outbound_headers=normalize_outbound_headers,
+        validate_inbound_headers=validate_inbound_headers,
+        normalize_inbound_headers=normalize_inbound_headers,
+    )
+
+
+_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    h2.exceptions.ProtocolError,
+    h2.exceptions.H2Error,
+)
+
+
 class HTTP2ProtocolHyperImpl(HTTP2Protocol):
     implementation: str = "h2"
 
@@ -48,29 +77,28 @@ class HTTP2ProtocolHyperImpl(HTTP2Protocol):
         normalize_inbound_headers: bool = True,
     ) -> None:
         self._connection: h2.connection.H2Connection = h2.connection.H2Connection(
-            h2.config.H2Configuration(
-                client_side=True,
-                validate_outbound_headers=validate_outbound_headers,
-                normalize_outbound_headers=normalize_outbound_headers,
-                validate_inbound_headers=validate_inbound_headers,
-                normalize_inbound_headers=normalize_inbound_headers,
+            _get_h2_config(
+                validate_outbound_headers,
+                validate_inbound_headers,
+                normalize_outbound_headers,
+                normalize_inbound_headers,
             )
         )
         self._connection.initiate_connection()
         self._events: deque[Event] = deque()
-        self._terminated: bool = False
+        self._terminated_event: ConnectionTerminated | None = None
 
     @staticmethod
     def exceptions() -> tuple[type[BaseException], ...]:
-        return h2.exceptions.ProtocolError, h2.exceptions.H2Error
+        return _EXCEPTIONS
 
     def is_available(self) -> bool:
         # TODO: check that we do not run out of stream IDs.
-        return not self._terminated
+        return self._terminated_event is None
 
     def has_expired(self) -> bool:
         # TODO: check that we do not run out of stream IDs.
-        return self._terminated
+        return self._terminated_event is not None
 
     def get_available_stream_id(self) -> int:
         return self._connection.get_next_available_stream_id()  # type: ignore[no-any-return]
@@ -98,38 +126,47 @@ class HTTP2ProtocolHyperImpl(HTTP2Protocol):
         return self._events.popleft()
 
     def has_pending_event(self) -> bool:
-        return len(self._events) > 0
+        return bool(self._events)
 
-    def _map_events(self, h2_events: list[h2.events.Event]) -> Iterator[Event]:
+    def _map_events(self, h2_events: list[h2.events.Event]) -> list[Event]:
+        events: list[Event] = []
+        append = events.append
         for e in h2_events:
-            if isinstance(
-                e,
-                (
-                    h2.events.RequestReceived,
-                    h2.events.ResponseReceived,
-                    h2.events.TrailersReceived,
-                ),
-            ):
-                end_stream = e.stream_ended is not None
-                yield HeadersReceived(e.stream_id, e.headers, end_stream=end_stream)
-            elif isinstance(e, h2.events.DataReceived):
-                end_stream = e.stream_ended is not None
-                self._connection.acknowledge_received_data(
-                    e.flow_controlled_length, e.stream_id
-                )
-                yield DataReceived(e.stream_id, e.data, end_stream=end_stream)
-            elif isinstance(e, h2.events.StreamReset):
-                yield StreamResetReceived(e.stream_id, e.error_code)
-            elif isinstance(e, h2.events.ConnectionTerminated):
-                # ConnectionTerminated from h2 means that GOAWAY was received.
-                # A server can send GOAWAY for graceful shutdown, where clients
-                # do not open new streams, but inflight requests can be completed.
-                #
-                # Saying "connection was terminated" can be confusing,
-                # so we emit an event called "GoawayReceived".
-                yield GoawayReceived(e.last_stream_id, e.error_code)
-            elif isinstance(e, h2.events.SettingsAcknowledged):
-                yield HandshakeCompleted(alpn_protocol="h2")
+            handler = _H2_EVENT_HANDLERS.get(type(e))
+            if handler is not None:
+                append(handler(self, e))
+        return events
+
+    def _map_headers(
+        self,
+        e: h2.events.RequestReceived
+        | h2.events.ResponseReceived
+        | h2.events.TrailersReceived,
+    ) -> Event:
+        return HeadersReceived(
+            e.stream_id, e.headers, end_stream=e.stream_ended is not None
+        )
+
+    def _map_data(self, e: h2.events.DataReceived) -> Event:
+        self._connection.acknowledge_received_data(
+            e.flow_controlled_length, e.stream_id
+        )
+        return DataReceived(e.stream_id, e.data, end_stream=e.stream_ended is not None)
+
+    def _map_stream_reset(self, e: h2.events.StreamReset) -> Event:
+        return StreamResetReceived(e.stream_id, e.error_code)
+
+    def _map_goaway(self, e: h2.events.ConnectionTerminated) -> Event:
+        # ConnectionTerminated from h2 means that GOAWAY was received.
+        # A server can send GOAWAY for graceful shutdown, where clients
+        # do not open new streams, but inflight requests can be completed.
+        #
+        # Saying "connection was terminated" can be confusing,
+        # so we emit an event called "GoawayReceived".
+        return GoawayReceived(e.last_stream_id, e.error_code)
+
+    def _map_settings_acknowledged(self, e: h2.events.SettingsAcknowledged) -> Event:
+        return HandshakeCompleted(alpn_protocol="h2")
 
     def connection_lost(self) -> None:
         self._connection_terminated()
@@ -148,13 +185,28 @@ class HTTP2ProtocolHyperImpl(HTTP2Protocol):
             self._events.extend(self._map_events(h2_events))
 
     def bytes_to_send(self) -> bytes:
-        return cast(bytes, self._connection.data_to_send())
+        return self._connection.data_to_send()  # type: ignore[no-any-return]
 
     def _connection_terminated(
         self, error_code: int = 0, message: str | None = None
     ) -> None:
-        if self._terminated:
+        if self._terminated_event is not None:
             return
-        error_code = int(error_code)  # Convert h2 IntEnum to an actual int
-        self._terminated = True
-        self._events.append(ConnectionTerminated(error_code, message))
+        # Convert h2 IntEnum to an actual int
+        self._terminated_event = ConnectionTerminated(int(error_code), message)
+        self._events.append(self._terminated_event)
+
+
+#: Maps h2 event types to their handlers. Lookups are done on the exact type,
+#: h2 events we do not care about are simply ignored.
+_H2_EVENT_HANDLERS: dict[
+    type[h2.events.Event], Callable[[HTTP2ProtocolHyperImpl, Any], Event]
+] = {
+    h2.events.RequestReceived: HTTP2ProtocolHyperImpl._map_headers,
+    h2.events.ResponseReceived: HTTP2ProtocolHyperImpl._map_headers,
+    h2.events.TrailersReceived: HTTP2ProtocolHyperImpl._map_headers,
+    h2.events.DataReceived: HTTP2ProtocolHyperImpl._map_data,
+    h2.events.StreamReset: HTTP2ProtocolHyperImpl._map_stream_reset,
+    h2.events.ConnectionTerminated: HTTP2ProtocolHyperImpl._map_goaway,
+    h2.events.SettingsAcknowledged: HTTP2ProtocolHyperImpl._map_settings_acknowledged,
+}
@@ -17,7 +17,7 @@ from __future__ import annotations
 import ssl
 from collections import deque
 from time import monotonic
-from typing import Iterable, Sequence
+from typing import Any, Callable, Sequence
 
 import qh3.h3.events as h3_events
 import qh3.quic.events as quic_events
@@ -34,6 +34,17 @@ from ...events import HandshakeCompleted as _HandshakeCompleted
 from ...events import HeadersReceived, StreamResetReceived
 from .._protocols import HTTP3Protocol
 
+#: CONNECTION_CLOSE frame types, see :meth:`HTTP3ProtocolAioQuicImpl.submit_close`.
+_FRAME_TYPE_NO_ERROR = 0x1C
+_FRAME_TYPE_APP_ERROR = 0x1D
+
+
+_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    ProtocolError,
+    H3Error,
+    QuicConnectionError,
+)
+
 
 class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
     implementation: str = "aioquic"
@@ -67,6 +78,7 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
 
         self._quic: QuicConnection = QuicConnection(configuration=self._configuration)
         self._connection_ids: set[bytes] = set()
+        self._connection_ids_snapshot: tuple[bytes, ...] | None = None
         self._remote_address = remote_address
         self._event_buffer: deque[Event] = deque()
         self._http: H3Connection | None = None
@@ -74,7 +86,7 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
 
     @staticmethod
     def exceptions() -> tuple[type[BaseException], ...]:
-        return ProtocolError, H3Error, QuicConnectionError
+        return _EXCEPTIONS
 
     def is_available(self) -> bool:
         # TODO: check concurrent stream limit
@@ -101,14 +113,17 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
         # > at only the QUIC layer, or the absence of errors (with the NO_ERROR code).
         # > The CONNECTION_CLOSE frame with a type of 0x1d is used
         # > to signal an error with the application that uses QUIC.
-        frame_type = 0x1D if error_code else 0x1C
+        frame_type = _FRAME_TYPE_APP_ERROR if error_code else _FRAME_TYPE_NO_ERROR
         self._quic.close(error_code=error_code, frame_type=frame_type)
 
     def submit_headers(
         self, stream_id: int, headers: HeadersType, end_stream: bool = False
     ) -> None:
         assert self._http is not None
-        self._http.send_headers(stream_id, list(headers), end_stream)
+        # qh3 expects a list, avoid copying the headers when we already have one.
+        if not isinstance(headers, list):
+            headers = list(headers)
+        self._http.send_headers(stream_id, headers, end_stream)
 
     def submit_data(
         self, stream_id: int, data: bytes, end_stream: bool = False
@@ -125,11 +140,13 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
         return self._event_buffer.popleft()
 
     def has_pending_event(self) -> bool:
-        return len(self._event_buffer) > 0
+        return bool(self._event_buffer)
 
     @property
     def connection_ids(self) -> Sequence[bytes]:
-        return list(self._connection_ids)
+        if self._connection_ids_snapshot is None:
+            self._connection_ids_snapshot = tuple(self._connection_ids)
+        return self._connection_ids_snapshot
 
     def clock(self, now: float) -> None:
         timer = self._quic.get_timer()
@@ -145,6 +162,8 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
         self._event_buffer.append(ConnectionTerminated())
 
     def bytes_received(self, data: bytes) -> None:
+        if not data:
+            return
         self._quic.receive_datagram(data, self._remote_address, now=monotonic())
         self._fetch_events()
 
@@ -155,44 +174,76 @@ class HTTP3ProtocolAioQuicImpl(HTTP3Protocol):
             self._quic.connect(self._remote_address, now=now)
             self._http = H3Connection(self._quic)
 
-        return b"".join(
-            list(map(lambda e: e[0], self._quic.datagrams_to_send(now=now)))
-        )
+        return b"".join([data for data, _ in self._quic.datagrams_to_send(now=now)])
 
     def _fetch_events(self) -> None:
         assert self._http is not None
 
-        for quic_event in iter(self._quic.next_event, None):
-            self._event_buffer += self._map_quic_event(quic_event)
-            for h3_event in self._http.handle_event(quic_event):
-                self._event_buffer += self._map_h3_event(h3_event)
-
-        if hasattr(self._quic, "_close_event") and self._quic._close_event is not None:
-            self._event_buffer += self._map_quic_event(self._quic._close_event)
-
-    def _map_quic_event(self, quic_event: quic_events.QuicEvent) -> Iterable[Event]:
-        if isinstance(quic_event, quic_events.ConnectionIdIssued):
-            self._connection_ids.add(quic_event.connection_id)
-        elif isinstance(quic_event, quic_events.ConnectionIdRetired):
-            try:
-                self._connection_ids.remove(quic_event.connection_id)
-            except (
-                KeyError
-            ):  # it is surprising, learn more about this with aioquic maintainer.
-                pass
-
-        if isinstance(quic_event, quic_events.HandshakeCompleted):
-            yield _HandshakeCompleted(quic_event.alpn_protocol)
-        elif isinstance(quic_event, quic_events.ConnectionTerminated):
-            self._terminated = True
-            yield ConnectionTerminated(quic_event.error_code, quic_event.reason_phrase)
-        elif isinstance(quic_event, quic_events.StreamReset):
-            yield StreamResetReceived(quic_event.stream_id, quic_event.error_code)
-
-    def _map_h3_event(self, h3_event: h3_events.H3Event) -> Iterable[Event]:
-        if isinstance(h3_event, h3_events.HeadersReceived):
-            yield HeadersReceived(
-                h3_event.stream_id, h3_event.headers, h3_event.stream_ended
-            )
-        elif isinstance(h3_event, h3_events.DataReceived):
-            yield DataReceived(h3_event.stream_id, h3_event.data, h3_event.stream_ended)
+        append = self._event_buffer.append
+        next_quic_event = self._quic.next_event
+        handle_event = self._http.handle_event
+
+        while True:
+            quic_event = next_quic_event()
+            if quic_event is None:
+                break
+            handler = _QUIC_EVENT_HANDLERS.get(type(quic_event))
+            if handler is not None:
+                event = handler(self, quic_event)
+                if event is not None:
+                    append(event)
+            for h3_event in handle_event(quic_event):
+                h3_handler = _H3_EVENT_HANDLERS.get(type(h3_event))
+                if h3_handler is not None:
+                    append(h3_handler(self, h3_event))
+
+        close_event = getattr(self._quic, "_close_event", None)
+        if close_event is not None:
+            append(self._map_connection_terminated(close_event))
+
+    def _on_connection_id_issued(self, e: quic_events.ConnectionIdIssued) -> None:
+        self._connection_ids.add(e.connection_id)
+        self._connection_ids_snapshot = None
+
+    def _on_connection_id_retired(self, e: quic_events.ConnectionIdRetired) -> None:
+        # qh3 may retire a connection ID we never saw issued.
+        self._connection_ids.discard(e.connection_id)
+        self._connection_ids_snapshot = None
+
+    def _map_handshake_completed(self, e: quic_events.HandshakeCompleted) -> Event:
+        return _HandshakeCompleted(e.alpn_protocol)
+
+    def _map_connection_terminated(self, e: quic_events.ConnectionTerminated) -> Event:
+        self._terminated = True
+        return ConnectionTerminated(e.error_code, e.reason_phrase)
+
+    def _map_stream_reset(self, e: quic_events.StreamReset) -> Event:
+        return StreamResetReceived(e.stream_id, e.error_code)
+
+    def _map_headers(self, e: h3_events.HeadersReceived) -> Event:
+        return HeadersReceived(e.stream_id, e.headers, e.stream_ended)
+
+    def _map_data(self, e: h3_events.DataReceived) -> Event:
+        return DataReceived(e.stream_id, e.data, e.stream_ended)
+
+
+#: Maps QUIC event types to their handlers. Lookups are done on the exact type.
+#: A handler may only update the protocol state and return None.
+_QUIC_EVENT_HANDLERS: dict[
+    type[quic_events.QuicEvent],
+    Callable[[HTTP3ProtocolAioQuicImpl, Any], Event | None],
+] = {
+    quic_events.ConnectionIdIssued: HTTP3ProtocolAioQuicImpl._on_connection_id_issued,
+    quic_events.ConnectionIdRetired: HTTP3ProtocolAioQuicImpl._on_connection_id_retired,
+    quic_events.HandshakeCompleted: HTTP3ProtocolAioQuicImpl._map_handshake_completed,
+    quic_events.ConnectionTerminated: HTTP3ProtocolAioQuicImpl._map_connection_terminated,
+    quic_events.StreamReset: HTTP3ProtocolAioQuicImpl._map_stream_reset,
+}
+
+#: Maps HTTP/3 event types to their handlers. Lookups are done on the exact type.
+_H3_EVENT_HANDLERS: dict[
+    type[h3_events.H3Event], Callable[[HTTP3ProtocolAioQuicImpl, Any], Event]
+] = {
+    h3_events.HeadersReceived: HTTP3ProtocolAioQuicImpl._map_headers,
+    h3_events.DataReceived: HTTP3ProtocolAioQuicImpl._map_data,
+}
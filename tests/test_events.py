@@ -0,0 +1,75 @@
+# Copyright 2022 Akamai Technologies, Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from urllib3_ext_hface import QuicTLSConfig
+from urllib3_ext_hface.events import (
+    ConnectionTerminated,
+    DataReceived,
+    Event,
+    GoawayReceived,
+    HandshakeCompleted,
+    HeadersReceived,
+    StreamResetReceived,
+    StreamResetSent,
+)
+
+requires_slots = pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+"
+)
+
+
+@requires_slots
+@pytest.mark.parametrize(
+    "event",
+    [
+        ConnectionTerminated(),
+        GoawayReceived(1),
+        StreamResetReceived(1),
+        StreamResetSent(1),
+        HandshakeCompleted("h2"),
+        HeadersReceived(1, [(b":status", b"200")]),
+        DataReceived(1, b"data"),
+    ],
+)
+def test_event_has_no_dict(event: Event) -> None:
+    assert not hasattr(event, "__dict__")
+
+
+def test_event_end_stream_is_writable() -> None:
+    """
+    The HTTP/1 implementation flags the last event with end_stream.
+    """
+    event = DataReceived(1, b"data")
+    event.end_stream = True
+    assert event == DataReceived(1, b"data", end_stream=True)
+
+
+@requires_slots
+def test_tls_config_has_no_dict() -> None:
+    assert not hasattr(QuicTLSConfig(), "__dict__")
+
+
+def test_tls_config_clone() -> None:
+    config = QuicTLSConfig(insecure=True, cafile="ca.pem", session_ticket=object())
+    clone = config.clone()
+    assert clone is not config
+    assert clone == config
+    clone.cafile = "other.pem"
+    assert config.cafile == "ca.pem"
@@ -28,6 +28,7 @@ from urllib3_ext_hface.events import (
     StreamResetSent,
 )
 from urllib3_ext_hface.protocols import HTTPOverTCPProtocol, HTTPProtocolFactory, HTTP2Protocol
+from urllib3_ext_hface.protocols.http2 import HTTP2ProtocolHyperImpl
 
 CLIENT_MAGIC = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
 
@@ -416,3 +417,24 @@ class TestClient:
         stream_id = self._http_connect(client)
         client.bytes_received(build_data_frame(b"Bye", end_stream=True))
         assert client.next_event() == DataReceived(stream_id, b"Bye", end_stream=True)
+
+
+class TestConfiguration:
+    def test_shared_with_same_flags(self) -> None:
+        """
+        Connections with the same flags share one h2 configuration.
+        """
+        first = HTTP2ProtocolHyperImpl()
+        second = HTTP2ProtocolHyperImpl()
+        assert first._connection.config is second._connection.config
+
+    def test_not_shared_with_different_flags(self) -> None:
+        """
+        Connections with different flags get their own h2 configuration.
+        """
+        default = HTTP2ProtocolHyperImpl()
+        validating = HTTP2ProtocolHyperImpl(validate_inbound_headers=True)
+        assert default._connection.config is not validating._connection.config
+        assert not default._connection.config.validate_inbound_headers
+        assert validating._connection.config.validate_inbound_headers
+        assert validating._connection.config.client_side
@@ -0,0 +1,346 @@
+# Copyright 2022 Akamai Technologies, Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import datetime
+from time import monotonic
+from typing import Any
+
+import pytest
+import qh3.h3.events as h3_events
+import qh3.quic.events as quic_events
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from helpers import build_request_headers, build_response_headers
+from qh3.buffer import Buffer
+from qh3.h3.connection import H3Connection
+from qh3.quic.configuration import QuicConfiguration
+from qh3.quic.connection import QuicConnection
+from qh3.quic.packet import pull_quic_header
+
+from urllib3_ext_hface import QuicTLSConfig
+from urllib3_ext_hface.events import (
+    ConnectionTerminated,
+    DataReceived,
+    Event,
+    HandshakeCompleted,
+    HeadersReceived,
+)
+from urllib3_ext_hface.protocols import (
+    HTTP3Protocol,
+    HTTPOverQUICProtocol,
+    HTTPProtocolFactory,
+)
+
+CLIENT_ADDRESS = ("127.0.0.1", 50000)
+SERVER_ADDRESS = ("127.0.0.1", 443)
+
+
+@pytest.fixture(name="certificate", scope="module")
+def _certificate(tmp_path_factory: pytest.TempPathFactory) -> tuple[str, str]:
+    """
+    Generate a self-signed certificate for "localhost".
+    """
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False
+        )
+        .sign(key, hashes.SHA256())
+    )
+    directory = tmp_path_factory.mktemp("tls")
+    certfile = directory / "cert.pem"
+    keyfile = directory / "key.pem"
+    certfile.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    keyfile.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption(),
+        )
+    )
+    return str(certfile), str(keyfile)
+
+
+class Server:
+    """
+    Minimal in-process HTTP/3 server built directly on qh3.
+
+    It answers every complete request with a "200" response and a short body.
+    """
+
+    def __init__(self, certfile: str, keyfile: str) -> None:
+        self._configuration = QuicConfiguration(is_client=False, alpn_protocols=["h3"])
+        self._configuration.load_cert_chain(certfile, keyfile)
+        self.quic: QuicConnection | None = None
+        self.http: H3Connection | None = None
+
+    def datagram_received(self, data: bytes) -> None:
+        if self.quic is None:
+            header = pull_quic_header(Buffer(data=data), host_cid_length=8)
+            self.quic = QuicConnection(
+                configuration=self._configuration,
+                original_destination_connection_id=header.destination_cid,
+            )
+            self.http = H3Connection(self.quic)
+        assert self.http is not None
+        self.quic.receive_datagram(data, CLIENT_ADDRESS, now=monotonic())
+        for quic_event in iter(self.quic.next_event, None):
+            for h3_event in self.http.handle_event(quic_event):
+                if isinstance(h3_event, h3_events.HeadersReceived):
+                    if h3_event.stream_ended:
+                        self.http.send_headers(
+                            h3_event.stream_id, build_response_headers()
+                        )
+                        self.http.send_data(
+                            h3_event.stream_id, b"Hello HTTP/3!", end_stream=True
+                        )
+
+    def datagrams_to_send(self) -> list[bytes]:
+        if self.quic is None:
+            return []
+        return [data for data, _ in self.quic.datagrams_to_send(now=monotonic())]
+
+
+@pytest.fixture(name="client")
+def _client(certificate: tuple[str, str]) -> HTTPOverQUICProtocol:
+    certfile, _ = certificate
+    protocol = HTTPProtocolFactory.new(
+        HTTP3Protocol,
+        remote_address=SERVER_ADDRESS,
+        server_name="localhost",
+        tls_config=QuicTLSConfig(cafile=certfile),
+    )
+    assert isinstance(protocol, HTTPOverQUICProtocol)
+    return protocol
+
+
+@pytest.fixture(name="server")
+def _server(certificate: tuple[str, str]) -> Server:
+    return Server(*certificate)
+
+
+def exchange(client: HTTPOverQUICProtocol, server: Server) -> None:
+    """
+    Transfer datagrams between the client and the server until both are idle.
+    """
+    while True:
+        data = client.bytes_to_send()
+        if data:
+            server.datagram_received(data)
+        datagrams = server.datagrams_to_send()
+        for datagram in datagrams:
+            client.bytes_received(datagram)
+        if not data and not datagrams:
+            break
+
+
+def fetch_events(client: HTTPOverQUICProtocol) -> list[Event]:
+    events = []
+    while client.has_pending_event():
+        event = client.next_event()
+        assert event is not None
+        events.append(event)
+    assert client.next_event() is None
+    return events
+
+
+def handshake(client: HTTPOverQUICProtocol, server: Server) -> None:
+    exchange(client, server)
+    assert fetch_events(client) == [HandshakeCompleted(alpn_protocol="h3")]
+
+
+def inject_quic_events(
+    client: HTTPOverQUICProtocol, *events: quic_events.QuicEvent
+) -> None:
+    """
+    Make the client process QUIC events as if they were emitted by qh3.
+    """
+    quic: Any = client._quic  # type: ignore[attr-defined]
+    quic._events.extend(events)
+    client._fetch_events()  # type: ignore[attr-defined]
+
+
+class TestConnectionIds:
+    def test_cached(self, client: HTTPOverQUICProtocol, server: Server) -> None:
+        """
+        Test that repeated reads return the same tuple.
+        """
+        handshake(client, server)
+        connection_ids = client.connection_ids
+        assert isinstance(connection_ids, tuple)
+        assert client.connection_ids is connection_ids
+
+    def test_refreshed_on_issued(
+        self, client: HTTPOverQUICProtocol, server: Server
+    ) -> None:
+        """
+        Test that the cache is refreshed when a connection ID is issued.
+        """
+        handshake(client, server)
+        before = client.connection_ids
+        inject_quic_events(client, quic_events.ConnectionIdIssued(b"new-cid"))
+        assert client.connection_ids is not before
+        assert set(client.connection_ids) == set(before) | {b"new-cid"}
+
+    def test_refreshed_on_retired(
+        self, client: HTTPOverQUICProtocol, server: Server
+    ) -> None:
+        """
+        Test that the cache is refreshed when a connection ID is retired.
+        """
+        handshake(client, server)
+        before = client.connection_ids
+        retired = before[0]
+        inject_quic_events(client, quic_events.ConnectionIdRetired(retired))
+        assert client.connection_ids is not before
+        assert set(client.connection_ids) == set(before) - {retired}
+
+    def test_retired_never_issued(
+        self, client: HTTPOverQUICProtocol, server: Server
+    ) -> None:
+        """
+        Test that retiring an unknown connection ID is harmless.
+        """
+        handshake(client, server)
+        before = client.connection_ids
+        inject_quic_events(client, quic_events.ConnectionIdRetired(b"unknown"))
+        assert client.connection_ids is not before
+        assert client.connection_ids == before
+        assert fetch_events(client) == []
+
+
+class TestClient:
+    def test_handshake(self, client: HTTPOverQUICProtocol, server: Server) -> None:
+        """
+        Test that the handshake completes and the connection can be used.
+        """
+        assert client.connection_ids == ()
+        handshake(client, server)
+        assert client.is_available()
+        assert not client.has_expired()
+        assert len(client.connection_ids) > 0
+
+    def test_get(self, client: HTTPOverQUICProtocol, server: Server) -> None:
+        """
+        Test a GET request and its response.
+        """
+        handshake(client, server)
+        stream_id = client.get_available_stream_id()
+        client.submit_headers(stream_id, build_request_headers(), end_stream=True)
+        exchange(client, server)
+        assert fetch_events(client) == [
+            HeadersReceived(stream_id, build_response_headers()),
+            DataReceived(stream_id, b"Hello HTTP/3!", end_stream=True),
+        ]
+        assert client.is_available()
+
+    def test_get_headers_as_tuple(
+        self, client: HTTPOverQUICProtocol, server: Server
+    ) -> None:
+        """
+        Test that headers do not have to be given as a list.
+        """
+        handshake(client, server)
+        stream_id = client.get_available_stream_id()
+        client.submit_headers(
+            stream_id, tuple(build_request_headers()), end_stream=True
+        )
+        exchange(client, server)
+        assert fetch_events(client)[0] == HeadersReceived(
+            stream_id, build_response_headers()
+        )
+
+    def test_connection_id_retired(
+        self, client: HTTPOverQUICProtocol, server: Server
+    ) -> None:
+        """
+        Test that connection IDs are tracked when the peer retires them.
+        """
+        handshake(client, server)
+        issued = set(client.connection_ids)
+        assert server.quic is not None
+        # The first switch retires the handshake connection ID, which is never
+        # announced through ConnectionIdIssued. The second one retires an ID
+        # that was announced.
+        server.quic.change_connection_id()
+        server.quic.change_connection_id()
+        exchange(client, server)
+        assert fetch_events(client) == []
+        assert len(issued - set(client.connection_ids)) == 1
+
+    def test_empty_datagram(self, client: HTTPOverQUICProtocol, server: Server) -> None:
+        """
+        Test that empty data is ignored.
+        """
+        handshake(client, server)
+        client.bytes_received(b"")
+        assert fetch_events(client) == []
+        assert client.bytes_to_send() == b""
+
+    def test_closed_by_server(
+        self, client: HTTPOverQUICProtocol, server: Server
+    ) -> None:
+        """
+        Test that a CONNECTION_CLOSE from the server terminates the connection.
+        """
+        handshake(client, server)
+        assert server.quic is not None
+        server.quic.close(error_code=0x0101, reason_phrase="bye")
+        exchange(client, server)
+        event = client.next_event()
+        assert event == ConnectionTerminated(error_code=0x0101, message="bye")
+        assert isinstance(event, ConnectionTerminated)
+        assert event.message == "bye"
+        assert client.has_expired()
+        assert not client.is_available()
+
+    @pytest.mark.parametrize("error_code", [0, 0x0101])
+    def test_submit_close(
+        self, client: HTTPOverQUICProtocol, server: Server, error_code: int
+    ) -> None:
+        """
+        Test that closing the connection is reported to the server.
+        """
+        handshake(client, server)
+        client.submit_close(error_code)
+        exchange(client, server)
+        assert server.quic is not None
+        closed: Any = server.quic._close_event
+        assert closed is not None
+        assert closed.error_code == error_code
+
+    def test_connection_lost(
+        self, client: HTTPOverQUICProtocol, server: Server
+    ) -> None:
+        """
+        Test connection lost without the QUIC connection being closed.
+        """
+        handshake(client, server)
+        client.connection_lost()
+        assert fetch_events(client) == [ConnectionTerminated()]
+        assert client.has_expired()
+        assert not client.is_available()